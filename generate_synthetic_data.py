@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+Synthetic Dataset Generator
+Scales the seed data (users_seed.json, users_by_role.json and
+ai_advisor_sample_data.json) up to benchmark sizes with realistic skill
+co-occurrence, so the ML/advisor layer can be exercised at production volume.
+
+Usage:
+    python generate_synthetic_data.py --scale 100k
+    python generate_synthetic_data.py --users 25000 --projects 8000 --out synthetic_data
+
+Output (streamed, so 1M users never sit in memory):
+    <out>/users.jsonl       one user per line, same shape as users_seed.json
+    <out>/projects.jsonl    one project per line, shaped like project_opportunities
+    <out>/credentials.csv   email,password,role (same layout as credentials.csv)
+    <out>/manifest.json     counts, random seed, skill vocabulary and timings
+
+--skills grows the vocabulary beyond the ~60 seed skills with long-tail
+variants attached to the co-occurrence graph, so skill-index and matching
+benchmarks see a sparse skill space at 100k/1M users.
+"""
+import argparse
+import bisect
+import csv
+import json
+import os
+import random
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# (users, projects, skills) per preset
+SCALES = {
+    "10k": (10_000, 4_000, 500),
+    "100k": (100_000, 40_000, 2_000),
+    "1m": (1_000_000, 400_000, 10_000),
+}
+
+PROJECT_STATUSES = [("OPEN", 0.45), ("IN_PROGRESS", 0.25), ("COMPLETED", 0.25), ("CANCELLED", 0.05)]
+PROJECT_KINDS = ["Dashboard", "Platform", "Integration", "Migration", "Mobile App", "API", "Redesign", "Pipeline"]
+DIFFICULTY_LEVELS = ["Beginner", "Intermediate", "Advanced"]
+DURATIONS = ["1 week", "2 weeks", "3 weeks", "4 weeks", "2 months", "3 months"]
+
+# Probability that the next skill is drawn from the global distribution
+# instead of from the co-occurrence row of the previously picked skill.
+RESTART_PROBABILITY = 0.2
+
+# Qualifiers used to name long-tail skills derived from a seed skill
+LONG_TAIL_QUALIFIERS = [
+    "Testing", "Performance", "Security", "Migration", "Architecture", "Automation",
+    "Plugins", "Internals", "Integration", "Monitoring", "Tooling", "Analytics",
+]
+
+
+def load_json(name):
+    with open(os.path.join(ROOT, name), encoding="utf-8") as f:
+        return json.load(f)
+
+
+class WeightedSampler:
+    """Draws keys proportionally to their weights in O(log n) per draw"""
+
+    def __init__(self, weights):
+        self.keys = list(weights)
+        self.cumulative = []
+        total = 0.0
+        for key in self.keys:
+            total += weights[key]
+            self.cumulative.append(total)
+        self.total = total
+
+    def sample(self, rng):
+        return self.keys[bisect.bisect_right(self.cumulative, rng.random() * self.total)]
+
+
+class SkillModel:
+    """
+    Skill frequencies and pairwise co-occurrence learned from the seed data.
+
+    Skill sets are produced by a random walk: the first skill follows the
+    global frequency, each following skill follows the co-occurrence row of
+    the previous one (with an occasional restart), which keeps stacks such as
+    React/Next.js/TypeScript together the way they appear in the seeds.
+    """
+
+    def __init__(self, skill_sets):
+        self.frequency = Counter()
+        self.co_occurrence = defaultdict(Counter)
+        for skills in skill_sets:
+            unique = list(dict.fromkeys(skills))
+            self.frequency.update(unique)
+            for a in unique:
+                for b in unique:
+                    if a != b:
+                        self.co_occurrence[a][b] += 1
+        self._build_samplers()
+
+    def _build_samplers(self):
+        self.global_sampler = WeightedSampler(self.frequency)
+        self.neighbour_samplers = {
+            skill: WeightedSampler(row) for skill, row in self.co_occurrence.items() if row
+        }
+
+    def extend(self, rng, total):
+        """
+        Grow the vocabulary to `total` skills with long-tail variants of the seed
+        skills (e.g. "Django Security"). Each new skill gets a Zipf-like weight
+        below the rarest seed skill and co-occurs with its parent and one of the
+        parent's neighbours, so it shows up inside realistic stacks.
+        """
+        seed_skills = sorted(self.frequency)
+        floor = min(self.frequency.values())
+        index = 0
+        while len(self.frequency) < total:
+            parent = seed_skills[index % len(seed_skills)]
+            qualifier = LONG_TAIL_QUALIFIERS[(index // len(seed_skills)) % len(LONG_TAIL_QUALIFIERS)]
+            generation = index // (len(seed_skills) * len(LONG_TAIL_QUALIFIERS))
+            name = f"{parent} {qualifier}" + (f" {generation + 1}" if generation else "")
+            index += 1
+            if name in self.frequency:
+                continue
+
+            weight = floor / (1 + index / len(seed_skills))
+            self.frequency[name] = weight
+            neighbours = [parent]
+            if self.co_occurrence[parent]:
+                neighbours.append(rng.choice(sorted(self.co_occurrence[parent])))
+            for neighbour in neighbours:
+                self.co_occurrence[name][neighbour] += weight
+                self.co_occurrence[neighbour][name] += weight
+        self._build_samplers()
+
+    @property
+    def vocabulary(self):
+        return sorted(self.frequency)
+
+    def sample(self, rng, count):
+        count = min(count, len(self.frequency))
+        chosen = [self.global_sampler.sample(rng)]
+        attempts = 0
+        while len(chosen) < count and attempts < count * 10:
+            attempts += 1
+            sampler = self.neighbour_samplers.get(chosen[-1])
+            if sampler is None or rng.random() < RESTART_PROBABILITY:
+                sampler = self.global_sampler
+            skill = sampler.sample(rng)
+            if skill not in chosen:
+                chosen.append(skill)
+        return chosen
+
+
+def build_skill_model(seed_users, sample_data):
+    """Collect every skill set the seed files describe"""
+    skill_sets = []
+    for user in seed_users:
+        if user.get("skills"):
+            skill_sets.append(user["skills"])
+        company = user.get("company") or {}
+        if company.get("tech_stack"):
+            skill_sets.append(company["tech_stack"])
+
+    for profile in sample_data.get("user_profiles", []):
+        skills = [s["skill"] for s in profile.get("current_skills", [])]
+        if skills:
+            skill_sets.append(skills)
+
+    for project in sample_data.get("project_opportunities", {}).get("trending_projects", []):
+        if project.get("required_skills"):
+            skill_sets.append(project["required_skills"])
+
+    return SkillModel(skill_sets)
+
+
+class SyntheticDataGenerator:
+    def __init__(self, seed_users, role_mix, sample_data, rng):
+        self.rng = rng
+        self.skill_model = build_skill_model(seed_users, sample_data)
+        self.role_sampler = WeightedSampler(role_mix)
+
+        self.first_names = sorted({u["first_name"] for u in seed_users})
+        self.last_names = sorted({u["last_name"] for u in seed_users})
+        self.locations = sorted({u["location"] for u in seed_users if u.get("location")})
+        self.domains = sorted({u["email"].split("@")[1] for u in seed_users})
+        self.passwords = {u["role"]: u["password_plain"] for u in seed_users}
+
+        companies = [u["company"] for u in seed_users if u.get("company")]
+        self.company_names = sorted({c["name"] for c in companies})
+        self.industries = sorted({c["industry"] for c in companies})
+        self.company_sizes = sorted({c["size"] for c in companies})
+
+        created = [datetime.fromisoformat(u["created_at"]) for u in seed_users]
+        self.created_from = min(created)
+        self.created_span = (max(created) - self.created_from).total_seconds()
+
+        budgets = [p["budget"] for p in sample_data["project_opportunities"]["trending_projects"]]
+        self.average_budget = sample_data["platform_insights"].get(
+            "average_project_budget", sum(budgets) / len(budgets)
+        )
+
+        # Project owners are picked from the generated clients/agencies
+        self.owner_emails = []
+
+    def _created_at(self):
+        offset = timedelta(seconds=self.rng.random() * self.created_span)
+        return (self.created_from + offset).isoformat()
+
+    def generate_user(self, index):
+        rng = self.rng
+        role = self.role_sampler.sample(rng)
+        first_name = rng.choice(self.first_names)
+        last_name = rng.choice(self.last_names)
+        handle = f"{first_name.lower()}.{last_name.lower()}.{index}"
+
+        user = {
+            "email": f"{handle}@{rng.choice(self.domains)}",
+            "first_name": first_name,
+            "last_name": last_name,
+            "role": role,
+            "is_verified": rng.random() < 0.9,
+            "is_active": rng.random() < 0.95,
+            "location": rng.choice(self.locations),
+            "phone": f"+1-{rng.randint(200, 999)}-{rng.randint(100, 999)}-{rng.randint(1000, 9999)}",
+            "created_at": self._created_at(),
+            "password_plain": self.passwords.get(role, "Password#2025"),
+        }
+
+        if role == "freelancer":
+            skills = self.skill_model.sample(rng, rng.randint(3, 8))
+            user.update({
+                "bio": f"{first_name} {last_name} is a developer with experience in {', '.join(skills[:3])}.",
+                "linkedin_url": f"https://linkedin.com/in/{first_name.lower()}-{last_name.lower()}-{index}",
+                "github_url": f"https://github.com/{first_name.lower()}{last_name.lower()}{index}",
+                "website": None,
+                "skills": skills,
+            })
+        else:
+            name = rng.choice(self.company_names)
+            industry = rng.choice(self.industries)
+            slug = name.lower().replace(" ", "-")
+            user.update({
+                "bio": f"{name} is a {industry} {role} seeking top talent for ongoing projects and initiatives.",
+                "linkedin_url": f"https://linkedin.com/company/{slug}",
+                "github_url": None,
+                "website": f"https://www.{slug}.com",
+                "company": {
+                    "name": name,
+                    "industry": industry,
+                    "size": rng.choice(self.company_sizes),
+                    "headquarters": rng.choice(self.locations),
+                    "tech_stack": self.skill_model.sample(rng, rng.randint(3, 5)),
+                },
+            })
+            self.owner_emails.append(user["email"])
+
+        return user
+
+    def generate_project(self, index):
+        rng = self.rng
+        skills = self.skill_model.sample(rng, rng.randint(2, 5))
+        kind = rng.choice(PROJECT_KINDS)
+        difficulty = rng.choice(DIFFICULTY_LEVELS)
+        # Budgets in the seeds are right-skewed around the platform average
+        budget = int(round(rng.lognormvariate(0, 0.6) * self.average_budget * (0.8 + 0.2 * len(skills)) / 1.6, -1))
+
+        status = PROJECT_STATUSES[-1][0]
+        roll = rng.random()
+        for value, probability in PROJECT_STATUSES:
+            if roll < probability:
+                status = value
+                break
+            roll -= probability
+
+        return {
+            "project_id": f"proj_{index:07d}",
+            "title": f"{skills[0]} {kind}",
+            "description": f"{difficulty} {kind.lower()} project using {', '.join(skills)}.",
+            "budget": max(budget, 100),
+            "duration": rng.choice(DURATIONS),
+            "required_skills": skills,
+            "difficulty_level": difficulty,
+            "status": status,
+            "client_email": rng.choice(self.owner_emails) if self.owner_emails else None,
+            "created_at": self._created_at(),
+        }
+
+
+def report_progress(label, done, total, started):
+    elapsed = time.time() - started
+    rate = done / elapsed if elapsed else 0
+    print(f"   {label}: {done:,}/{total:,} ({rate:,.0f} rows/s)", flush=True)
+
+
+def generate(users, projects, skills, out_dir, seed):
+    print("GENERATING SYNTHETIC WORKCONNECT DATASET")
+    print("=" * 50)
+
+    seed_users = load_json("users_seed.json")
+    by_role = load_json("users_by_role.json")
+    sample_data = load_json("ai_advisor_sample_data.json")
+
+    role_mix = {
+        "freelancer": len(by_role.get("freelancers", [])),
+        "client": len(by_role.get("clients", [])),
+        "agency": len(by_role.get("agencies", [])),
+    }
+    rng = random.Random(seed)
+    generator = SyntheticDataGenerator(seed_users, role_mix, sample_data, rng)
+    seed_skill_count = len(generator.skill_model.frequency)
+    print(f"📊 Seed: {len(seed_users)} users, {seed_skill_count} skills")
+    if skills > seed_skill_count:
+        generator.skill_model.extend(rng, skills)
+    else:
+        print(f"ℹ️  --skills {skills} is not above the seed vocabulary; keeping {seed_skill_count} skills")
+    skill_count = len(generator.skill_model.frequency)
+    print(f"🎯 Target: {users:,} users, {projects:,} projects, {skill_count:,} skills -> {out_dir}")
+
+    os.makedirs(out_dir, exist_ok=True)
+    progress_every = max(users // 10, 1)
+    timings = {}
+    role_counts = Counter()
+
+    started = time.time()
+    with open(os.path.join(out_dir, "users.jsonl"), "w", encoding="utf-8") as users_file, \
+            open(os.path.join(out_dir, "credentials.csv"), "w", newline="", encoding="utf-8") as creds_file:
+        writer = csv.writer(creds_file)
+        writer.writerow(["email", "password", "role"])
+        for i in range(1, users + 1):
+            user = generator.generate_user(i)
+            role_counts[user["role"]] += 1
+            users_file.write(json.dumps(user) + "\n")
+            writer.writerow([user["email"], user["password_plain"], user["role"]])
+            if i % progress_every == 0:
+                report_progress("Users", i, users, started)
+    timings["users_seconds"] = round(time.time() - started, 2)
+
+    started = time.time()
+    progress_every = max(projects // 10, 1)
+    with open(os.path.join(out_dir, "projects.jsonl"), "w", encoding="utf-8") as projects_file:
+        for i in range(1, projects + 1):
+            projects_file.write(json.dumps(generator.generate_project(i)) + "\n")
+            if i % progress_every == 0:
+                report_progress("Projects", i, projects, started)
+    timings["projects_seconds"] = round(time.time() - started, 2)
+
+    manifest = {
+        "generated_at": datetime.now().isoformat(),
+        "random_seed": seed,
+        "users": users,
+        "projects": projects,
+        "users_by_role": dict(role_counts),
+        "skill_count": skill_count,
+        "skills": generator.skill_model.vocabulary,
+        "timings": timings,
+    }
+    with open(os.path.join(out_dir, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+    print("\n" + "=" * 50)
+    print(f"✅ Users: {users:,} in {timings['users_seconds']}s")
+    print(f"✅ Projects: {projects:,} in {timings['projects_seconds']}s")
+    print(f"📁 Output: {os.path.abspath(out_dir)}")
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a scaled WorkConnect dataset from the seed files")
+    parser.add_argument("--scale", choices=sorted(SCALES), help="preset size (overridden by --users/--projects/--skills)")
+    parser.add_argument("--users", type=int, help="number of users to generate (at least 1)")
+    parser.add_argument("--projects", type=int, help="number of projects to generate (at least 0)")
+    parser.add_argument("--skills", type=int, help="skill vocabulary size; extra skills are generated as a long tail")
+    parser.add_argument("--seed", type=int, default=42, help="random seed for reproducible datasets")
+    parser.add_argument("--out", default=os.path.join(ROOT, "synthetic_data"), help="output directory")
+    args = parser.parse_args()
+
+    if args.users is not None and args.users < 1:
+        parser.error(f"--users must be at least 1, got {args.users}")
+    if args.projects is not None and args.projects < 0:
+        parser.error(f"--projects must be at least 0, got {args.projects}")
+    if args.skills is not None and args.skills < 1:
+        parser.error(f"--skills must be at least 1, got {args.skills}")
+
+    users, projects, skills = SCALES[args.scale or "10k"]
+    if args.users is not None:
+        users = args.users
+    if args.projects is not None:
+        projects = args.projects
+    if args.skills is not None:
+        skills = args.skills
+
+    generate(users, projects, skills, args.out, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+Concurrent Load Generator for the Career Advisor / Dashboard APIs
+Evolved from test_ai_advisor.py: instead of one blocking call per endpoint it
+logs in a pool of users from credentials.csv and replays a realistic traffic
+mix at a target request rate or concurrency, then reports throughput, error
+rate and a latency histogram per endpoint.
+
+Run it against a locally started backend with a local database:
+    python load_test_ai_advisor.py --users 50 --concurrency 20 --duration 60
+    python load_test_ai_advisor.py --rps 200 --duration 120 --json results.json
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import random
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import requests
+
+# Configuration
+BACKEND_URL = "http://localhost:5000"
+CREDENTIALS_FILE = "credentials.csv"
+REQUEST_TIMEOUT = 30
+
+# (method, path, weight) per role. Freelancers open the Career Advisor page,
+# clients and agencies mostly poll the dashboard and market data.
+TRAFFIC_MIX = {
+    "freelancer": [
+        ("GET", "/api/users/profile", 10),
+        ("GET", "/api/ml/recommendations/skills", 8),
+        ("GET", "/api/ml/recommendations/projects", 8),
+        ("GET", "/api/ml/recommendations/users", 6),
+        ("GET", "/api/market/trends", 6),
+        ("GET", "/api/ai/career-insight", 8),
+        ("GET", "/api/ai/recommendations", 8),
+        ("GET", "/api/ai/dashboard-summary", 10),
+        ("GET", "/api/ai/trending-skills?limit=5", 8),
+        ("GET", "/api/ai/market-analysis", 4),
+        ("GET", "/api/projects", 6),
+        ("GET", "/api/messages", 4),
+    ],
+    "client": [
+        ("GET", "/api/users/profile", 10),
+        ("GET", "/api/ml/recommendations/freelancers", 8),
+        ("GET", "/api/ai/dashboard-summary", 10),
+        ("GET", "/api/ai/trending-skills?limit=5", 6),
+        ("GET", "/api/ai/market-analysis", 6),
+        ("GET", "/api/market/trends", 4),
+        ("GET", "/api/projects", 10),
+        ("GET", "/api/messages", 6),
+        ("GET", "/api/ai-matching", 4),
+    ],
+}
+TRAFFIC_MIX["agency"] = TRAFFIC_MIX["client"]
+
+# Latency histogram bucket upper bounds in milliseconds
+HISTOGRAM_BUCKETS_MS = [10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+
+class Colors:
+    GREEN = '\033[92m'
+    RED = '\033[91m'
+    YELLOW = '\033[93m'
+    BLUE = '\033[94m'
+    END = '\033[0m'
+
+
+def print_success(message):
+    print(f"{Colors.GREEN}✓ {message}{Colors.END}")
+
+
+def print_error(message):
+    print(f"{Colors.RED}✗ {message}{Colors.END}")
+
+
+def print_info(message):
+    print(f"{Colors.BLUE}ℹ {message}{Colors.END}")
+
+
+def print_warning(message):
+    print(f"{Colors.YELLOW}⚠ {message}{Colors.END}")
+
+
+_thread_local = threading.local()
+
+
+def get_session():
+    """One keep-alive session per executor thread (requests.Session is not thread-safe)"""
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        _thread_local.session = session
+    return session
+
+
+def timed_request(method, url, headers=None, json_body=None):
+    """Blocking HTTP call run on the executor; returns (status, latency_ms, error)"""
+    started = time.perf_counter()
+    try:
+        response = get_session().request(method, url, headers=headers, json=json_body, timeout=REQUEST_TIMEOUT)
+        # Read the body so the latency covers the full transfer
+        response.content
+        return response.status_code, (time.perf_counter() - started) * 1000, None
+    except Exception as e:
+        return None, (time.perf_counter() - started) * 1000, type(e).__name__
+
+
+class EndpointStats:
+    def __init__(self):
+        self.latencies_ms = []
+        self.status_counts = defaultdict(int)
+        self.errors = 0
+        self.dropped = 0
+
+    def record(self, status, latency_ms, error):
+        self.latencies_ms.append(latency_ms)
+        self.status_counts[error or status] += 1
+        if error or status >= 400:
+            self.errors += 1
+
+    def record_dropped(self):
+        """A scheduled request that found every slot busy counts as an error"""
+        self.dropped += 1
+        self.errors += 1
+        self.status_counts["dropped"] += 1
+
+    def merge(self, other):
+        self.latencies_ms.extend(other.latencies_ms)
+        self.errors += other.errors
+        self.dropped += other.dropped
+        for key, count in other.status_counts.items():
+            self.status_counts[key] += count
+
+    def percentile(self, pct):
+        if not self.latencies_ms:
+            return 0.0
+        ordered = sorted(self.latencies_ms)
+        index = min(int(round(pct / 100 * (len(ordered) - 1))), len(ordered) - 1)
+        return ordered[index]
+
+    def histogram(self):
+        counts = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+        for latency in self.latencies_ms:
+            for i, bound in enumerate(HISTOGRAM_BUCKETS_MS):
+                if latency <= bound:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+        return counts
+
+    def summary(self, elapsed):
+        completed = len(self.latencies_ms)
+        total = completed + self.dropped
+        return {
+            "requests": total,
+            "completed": completed,
+            "dropped": self.dropped,
+            "throughput_rps": round(completed / elapsed, 2) if elapsed else 0,
+            "error_rate": round(self.errors / total, 4) if total else 0,
+            "p50_ms": round(self.percentile(50), 2),
+            "p95_ms": round(self.percentile(95), 2),
+            "p99_ms": round(self.percentile(99), 2),
+            "max_ms": round(max(self.latencies_ms), 2) if completed else 0,
+            "status_counts": {str(k): v for k, v in self.status_counts.items()},
+            "histogram_ms": dict(zip([f"<={b}" for b in HISTOGRAM_BUCKETS_MS] + ["inf"], self.histogram())),
+        }
+
+
+def load_credentials(path, roles, limit):
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = [row for row in csv.DictReader(f) if not roles or row["role"] in roles]
+    random.shuffle(rows)
+    return rows[:limit]
+
+
+async def login_pool(loop, base_url, credentials):
+    """Log every credential in concurrently and keep the ones that succeed"""
+
+    def login(row):
+        try:
+            response = get_session().post(
+                f"{base_url}/api/auth/login",
+                json={"email": row["email"], "password": row["password"]},
+                timeout=REQUEST_TIMEOUT,
+            )
+            if response.status_code == 200:
+                data = response.json()
+                role = data.get("user", {}).get("role", row["role"])
+                return {"email": row["email"], "role": role, "token": data.get("access_token")}
+        except Exception:
+            pass
+        return None
+
+    results = await asyncio.gather(*(loop.run_in_executor(None, login, row) for row in credentials))
+    return [session for session in results if session and session["token"]]
+
+
+def pick_request(user):
+    mix = TRAFFIC_MIX.get(user["role"], TRAFFIC_MIX["freelancer"])
+    method, path, _ = random.choices(mix, weights=[weight for _, _, weight in mix])[0]
+    return method, path
+
+
+class LoadGenerator:
+    def __init__(self, base_url, users, duration, concurrency, rps):
+        self.base_url = base_url
+        self.users = users
+        self.duration = duration
+        self.concurrency = concurrency
+        self.rps = rps
+        self.stats = defaultdict(EndpointStats)
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    def next_request(self):
+        user = random.choice(self.users)
+        method, path = pick_request(user)
+        headers = {"Authorization": f"Bearer {user['token']}"}
+        return f"{method} {path.split('?')[0]}", method, path, headers
+
+    async def fire(self, loop, request, scheduled=None):
+        """
+        Issue one request. With a `scheduled` start time (open loop) latency is
+        measured from the schedule, so scheduler lag is charged to the request
+        instead of disappearing.
+        """
+        name, method, path, headers = request
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            status, latency_ms, error = await loop.run_in_executor(
+                None, timed_request, method, f"{self.base_url}{path}", headers
+            )
+        finally:
+            self.in_flight -= 1
+        if scheduled is not None:
+            latency_ms = (time.perf_counter() - scheduled) * 1000
+        self.stats[name].record(status, latency_ms, error)
+
+    async def run_closed_loop(self, loop, deadline):
+        """Fixed concurrency: each worker issues its next request as soon as the last returns"""
+
+        async def worker():
+            while time.perf_counter() < deadline:
+                await self.fire(loop, self.next_request())
+
+        await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+
+    async def run_open_loop(self, loop, deadline):
+        """
+        Fixed arrival rate: requests start on schedule with at most `concurrency`
+        in flight. A request due while every slot is busy is dropped and counted
+        as an error rather than queued, so saturation shows up in the report
+        instead of as a backlog drained after the deadline.
+        """
+        interval = 1.0 / self.rps
+        next_start = time.perf_counter()
+        pending = set()
+
+        while next_start < deadline:
+            delay = next_start - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if time.perf_counter() >= deadline:
+                break
+            request = self.next_request()
+            if len(pending) >= self.concurrency:
+                self.stats[request[0]].record_dropped()
+            else:
+                task = asyncio.ensure_future(self.fire(loop, request, scheduled=next_start))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+            next_start += interval
+
+        if pending:
+            await asyncio.gather(*pending)
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        deadline = started + self.duration
+        progress = asyncio.ensure_future(self.report_progress(started, deadline))
+        if self.rps:
+            await self.run_open_loop(loop, deadline)
+        else:
+            await self.run_closed_loop(loop, deadline)
+        progress.cancel()
+        # No request is issued after the deadline, so throughput is reported
+        # over the requested window; the few in flight at the deadline are
+        # awaited but do not stretch it.
+        return self.duration
+
+    async def report_progress(self, started, deadline):
+        while time.perf_counter() < deadline:
+            await asyncio.sleep(5)
+            done = sum(len(s.latencies_ms) for s in self.stats.values())
+            elapsed = time.perf_counter() - started
+            print_info(f"{elapsed:5.0f}s  {done:,} requests  {done / elapsed:,.1f} req/s  in flight: {self.in_flight}")
+
+
+def print_report(stats, elapsed, peak_in_flight):
+    print("\n" + "=" * 100)
+    print("LOAD TEST SUMMARY")
+    print("=" * 100)
+    print(f"{'Endpoint':<45} {'Reqs':>7} {'RPS':>8} {'Err%':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}")
+
+    total = EndpointStats()
+    for name in sorted(stats):
+        s = stats[name].summary(elapsed)
+        total.merge(stats[name])
+        color = Colors.RED if s["error_rate"] > 0.01 else Colors.GREEN
+        print(f"{color}{name:<45}{Colors.END} {s['requests']:>7} {s['throughput_rps']:>8.1f} "
+              f"{s['error_rate'] * 100:>5.1f}% {s['p50_ms']:>8.1f} {s['p95_ms']:>8.1f} "
+              f"{s['p99_ms']:>8.1f} {s['max_ms']:>8.1f}")
+
+    overall = total.summary(elapsed)
+    print("-" * 100)
+    print(f"{'ALL':<45} {overall['requests']:>7} {overall['throughput_rps']:>8.1f} "
+          f"{overall['error_rate'] * 100:>5.1f}% {overall['p50_ms']:>8.1f} {overall['p95_ms']:>8.1f} "
+          f"{overall['p99_ms']:>8.1f} {overall['max_ms']:>8.1f}")
+    print(f"\nPeak in-flight requests: {peak_in_flight}")
+
+    print("\nLatency histogram (all endpoints, ms):")
+    counts = overall["histogram_ms"]
+    widest = max(counts.values()) or 1
+    for bucket, count in counts.items():
+        print(f"  {bucket:>7} | {'█' * int(40 * count / widest):<40} {count}")
+    return overall
+
+
+def positive_int(value):
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
+def positive_float(value):
+    number = float(value)
+    if not number > 0 or number == float("inf"):
+        raise argparse.ArgumentTypeError(f"must be a positive number, got {value}")
+    return number
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay Career Advisor / dashboard traffic against a local backend")
+    parser.add_argument("--base-url", default=BACKEND_URL)
+    parser.add_argument("--credentials", default=CREDENTIALS_FILE, help="CSV with email,password,role")
+    parser.add_argument("--users", type=positive_int, default=50, help="number of users to log in")
+    parser.add_argument("--roles", nargs="*", choices=sorted(TRAFFIC_MIX), help="only use these roles")
+    parser.add_argument("--duration", type=positive_float, default=60, help="test length in seconds")
+    parser.add_argument("--concurrency", type=positive_int, default=20, help="workers (closed loop) or max in flight (with --rps)")
+    parser.add_argument("--rps", type=positive_float, help="target request rate; omit for a fixed-concurrency run")
+    parser.add_argument("--json", help="write the per-endpoint summary to this file")
+    args = parser.parse_args()
+
+    print("\n╔" + "=" * 58 + "╗")
+    print("║" + " " * 12 + "AI CAREER ADVISOR - LOAD GENERATOR" + " " * 12 + "║")
+    print("╚" + "=" * 58 + "╝")
+    print(f"\n🔧 Backend URL: {args.base_url}")
+    started_at = datetime.now()
+    print(f"📅 Test Time: {started_at.strftime('%Y-%m-%d %H:%M:%S')}")
+    mode = f"{args.rps:g} req/s (max {args.concurrency} in flight)" if args.rps else f"{args.concurrency} concurrent workers"
+    print(f"🚦 Mode: {mode} for {args.duration:g}s")
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        # The default executor is capped at a few dozen threads; size it to the load
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=max(args.concurrency, args.users)))
+
+        credentials = load_credentials(args.credentials, args.roles, args.users)
+        print_info(f"Logging in {len(credentials)} users from {args.credentials}...")
+        users = await login_pool(loop, args.base_url, credentials)
+        if not users:
+            print_error("No user could log in; is the backend running and seeded?")
+            return None
+        print_success(f"{len(users)}/{len(credentials)} users authenticated")
+
+        generator = LoadGenerator(args.base_url, users, args.duration, args.concurrency, args.rps)
+        elapsed = await generator.run()
+        return generator, elapsed
+
+    result = asyncio.run(run())
+    if result is None:
+        return
+
+    generator, elapsed = result
+    overall = print_report(generator.stats, elapsed, generator.peak_in_flight)
+
+    if args.json:
+        report = {
+            "base_url": args.base_url,
+            "started_at": started_at.isoformat(),
+            "mode": "rps" if args.rps else "concurrency",
+            "target_rps": args.rps,
+            "concurrency": args.concurrency,
+            "duration_seconds": round(elapsed, 2),
+            "overall": overall,
+            "endpoints": {name: s.summary(elapsed) for name, s in generator.stats.items()},
+        }
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print_success(f"Results written to {args.json}")
+
+    if overall["error_rate"] > 0.01:
+        print_warning(f"Error rate {overall['error_rate'] * 100:.1f}% - the backend may be saturated")
+
+
+if __name__ == "__main__":
+    main()